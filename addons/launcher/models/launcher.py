@@ -4,6 +4,13 @@ server starts.
 
 Models can register functions to be run as threads by calling `register_method`
 from their `_register_hook` method.
+
+Registered objects that provide a `tick(sentinel)` method are not given a
+thread of their own. Instead, a single scheduler thread calls `tick` on each of
+them in turn; `tick` should do a short unit of work and return the number of
+seconds until it next needs calling, or None once it has finished. There is
+one scheduler per process, not per database: each ticker is scheduled once,
+however many databases are launched, and its thread has no `dbname`.
 """
 
 import functools
@@ -18,6 +25,17 @@ _logger = logging.getLogger(__name__)
 # This object is used to notify launched threads of a pending system shutdown
 _sentinel = threading.Event()
 
+# Threads started by launch, so that they can be inspected or joined.
+_threads = []
+
+# Tickers are run by a single scheduler thread for the whole process.
+# _tickers holds those still being ticked, _scheduled every ticker ever
+# handed to the scheduler, so that later launches do not restart them.
+_scheduler_running = False
+_scheduler_lock = threading.Lock()
+_tickers = []
+_scheduled = set()
+
 
 class Launcher(models.TransientModel):
     """A model that starts a thread for each of its records."""
@@ -26,6 +44,7 @@ class Launcher(models.TransientModel):
     _name = "launcher.launcher"
 
     _registered = []
+    _register_lock = threading.Lock()
 
     @classmethod
     def register_method(cls, method_obj):
@@ -36,15 +55,44 @@ class Launcher(models.TransientModel):
         """
         # Ideally we would use __init_subclass__ for this, but it doesn't seem
         # to play well with Odoo's way of initialising subclasses.
-        cls._registered.append(method_obj)
+        with cls._register_lock:
+            cls._registered.append(method_obj)
 
     def launch(self):
         """Launches a thread for each registered callable."""
-        for i, launchable in enumerate(self._registered):
-            t = threading.Thread(target=functools.partial(launchable, _sentinel))
+        # Registry reloads may register methods while we are launching.
+        with self._register_lock:
+            registered = tuple(self._registered)
+        # Tickers share a single scheduler thread; anything else gets its own.
+        tickers, launchables = [], []
+        for registrant in registered:
+            if callable(getattr(registrant, "tick", None)):
+                tickers.append(registrant)
+            else:
+                launchables.append(functools.partial(registrant, _sentinel))
+        _threads[:] = [t for t in _threads if t.is_alive()]
+        dbname = getattr(threading.current_thread(), "dbname", "?")
+        for launchable in launchables:
+            t = threading.Thread(
+                target=_run_launchable, args=(launchable,), name="odoo.launcher"
+            )
+            # Server.stop() joins non-daemon threads after notify_shutdown,
+            # whatever thread launch was called from.
+            t.daemon = False
             # Ensure db name is output in logs.
-            t.dbname = getattr(threading.currentThread(), "dbname", "?")
+            t.dbname = dbname
             t.start()
+            _threads.append(t)
+        if _add_tickers(tickers):
+            # The scheduler serves every database, so it gets no dbname.
+            t = threading.Thread(
+                target=_run_launchable,
+                args=(functools.partial(_schedule, _sentinel),),
+                name="odoo.launcher.scheduler",
+            )
+            t.daemon = False
+            t.start()
+            _threads.append(t)
         # Returning None protects against xmlrpc execute_kw calls launching
         # threads as a DOS.
         return None
@@ -54,6 +102,63 @@ class Launcher(models.TransientModel):
         Notify threads of system shutdown.
 
         Notified threads should act to make themselves joinable.
+
+        Launched threads are not daemonic, so `Server.stop()` joins them after
+        calling this method and before tearing down the registries. A callable
+        that ignores the sentinel holds up shutdown until it is forced with a
+        second signal.
         """
         _sentinel.set()
         return
+
+
+def _run_launchable(launchable):
+    try:
+        launchable()
+    except Exception:
+        _logger.exception("Launched callable %r failed", launchable)
+
+
+def _add_tickers(tickers):
+    """
+    Add `tickers` not already scheduled to the scheduler.
+
+    Returns True if a scheduler thread needs to be started for them.
+    """
+    global _scheduler_running
+    with _scheduler_lock:
+        for ticker in tickers:
+            if ticker not in _scheduled:
+                _scheduled.add(ticker)
+                _tickers.append(ticker)
+        if _scheduler_running or not _tickers:
+            return False
+        _scheduler_running = True
+        return True
+
+
+def _schedule(sentinel):
+    """Call `tick` on each scheduled ticker until they finish or shutdown."""
+    global _scheduler_running
+    while not sentinel.is_set():
+        with _scheduler_lock:
+            tickers = tuple(_tickers)
+            if not tickers:
+                _scheduler_running = False
+                return
+        delays = []
+        for ticker in tickers:
+            try:
+                delay = ticker.tick(sentinel)
+            except Exception:
+                _logger.exception("Launched ticker %r failed", ticker)
+                delay = None
+            if delay is None:
+                with _scheduler_lock:
+                    _tickers.remove(ticker)
+            else:
+                delays.append(delay)
+        if delays:
+            sentinel.wait(max(0, min(delays)))
+    with _scheduler_lock:
+        _scheduler_running = False
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import unittest
+from unittest import mock
+
+from odoo.tests import common
+
+from odoo.addons.launcher.models import launcher
+
+
+def isolate_launcher(test):
+    """Patch the launcher state shared across the process for `test`."""
+    for name, value in [('_sentinel', threading.Event()),
+                        ('_threads', []),
+                        ('_scheduler_running', False),
+                        ('_tickers', []),
+                        ('_scheduled', set())]:
+        patcher = mock.patch.object(launcher, name, value)
+        patcher.start()
+        test.addCleanup(patcher.stop)
+
+
+class Ticker(object):
+    """A ticker that asks to be called again `count` times, then finishes."""
+
+    def __init__(self, count=0, delay=0):
+        self.count = count
+        self.delay = delay
+        self.ticks = 0
+        self.ticked = threading.Event()
+        self.called = False
+
+    def __call__(self, sentinel):
+        self.called = True
+
+    def tick(self, sentinel):
+        self.ticks += 1
+        self.ticked.set()
+        return self.delay if self.ticks <= self.count else None
+
+
+class FailingTicker(Ticker):
+
+    def tick(self, sentinel):
+        self.ticks += 1
+        raise ValueError("tick failed")
+
+
+class TestSchedule(unittest.TestCase):
+
+    def setUp(self):
+        super(TestSchedule, self).setUp()
+        isolate_launcher(self)
+        self.sentinel = threading.Event()
+
+    def schedule(self, *tickers):
+        launcher._tickers.extend(tickers)
+        launcher._scheduler_running = True
+        launcher._schedule(self.sentinel)
+
+    def test_ticker_runs_until_it_returns_none(self):
+        """A ticker is called until it returns None."""
+        ticker = Ticker(count=3)
+        self.schedule(ticker)
+        self.assertEqual(ticker.ticks, 4)
+        self.assertFalse(launcher._tickers)
+        self.assertFalse(launcher._scheduler_running)
+
+    def test_failing_ticker_is_dropped(self):
+        """A ticker which raises is logged and not called again."""
+        ticker = FailingTicker()
+        other = Ticker(count=2)
+        with self.assertLogs(launcher._logger, 'ERROR'):
+            self.schedule(ticker, other)
+        self.assertEqual(ticker.ticks, 1)
+        self.assertEqual(other.ticks, 3)
+
+    def test_scheduler_exits_on_shutdown(self):
+        """The scheduler stops waiting once the sentinel is set."""
+        ticker = Ticker(count=1000, delay=60)
+        thread = threading.Thread(target=self.schedule, args=(ticker,))
+        thread.start()
+        self.assertTrue(ticker.ticked.wait(5))
+        self.sentinel.set()
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(ticker.ticks, 1)
+        self.assertFalse(launcher._scheduler_running)
+
+
+class TestLaunch(common.TransactionCase):
+
+    def setUp(self):
+        super(TestLaunch, self).setUp()
+        self.Launcher = self.env['launcher.launcher']
+        isolate_launcher(self)
+        patcher = mock.patch.object(launcher.Launcher, '_registered', [])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def join_launched(self):
+        for thread in launcher._threads:
+            thread.join(5)
+            self.assertFalse(thread.is_alive())
+
+    def test_launch_routes_tickers_to_scheduler(self):
+        """Plain callables get their own thread, tickers are scheduled."""
+        calls = []
+
+        def plain(sentinel):
+            calls.append((sentinel, threading.current_thread()))
+
+        ticker = Ticker()
+        self.Launcher.register_method(plain)
+        self.Launcher.register_method(ticker)
+        self.Launcher.launch()
+        self.assertEqual(len(launcher._threads), 2)
+        self.assertFalse(any(t.daemon for t in launcher._threads))
+        self.join_launched()
+
+        self.assertEqual(len(calls), 1)
+        sentinel, thread = calls[0]
+        self.assertIs(sentinel, launcher._sentinel)
+        self.assertNotEqual(thread, threading.current_thread())
+        self.assertEqual(ticker.ticks, 1)
+        self.assertFalse(ticker.called)
+
+    def test_launch_starts_one_scheduler(self):
+        """Launching several databases schedules each ticker once."""
+        ticker = Ticker(count=1000, delay=60)
+        self.Launcher.register_method(ticker)
+        self.Launcher.launch()
+        self.Launcher.launch()
+        self.assertEqual(len(launcher._threads), 1)
+        self.assertTrue(ticker.ticked.wait(5))
+        self.Launcher.notify_shutdown()
+        self.join_launched()
+        self.assertEqual(ticker.ticks, 1)
+
+    def test_finished_ticker_is_not_restarted(self):
+        """A ticker which has finished is not ticked by a later launch."""
+        ticker = Ticker()
+        self.Launcher.register_method(ticker)
+        self.Launcher.launch()
+        self.join_launched()
+        self.Launcher.launch()
+        self.join_launched()
+        self.assertEqual(ticker.ticks, 1)
@@ -2,6 +2,7 @@
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
 
 from contextlib import contextmanager
+import functools
 import unittest
 
 import psycopg2
@@ -12,21 +13,28 @@ from odoo.tests import common
 
 ADMIN_USER_ID = common.ADMIN_USER_ID
 
+@functools.lru_cache(maxsize=None)
+def get_registry():
+    """ Return the registry of the current database, looked up once. """
+    return odoo.registry(common.get_db_name())
+
+
 @contextmanager
 def environment():
     """ Return an environment with a new cursor for the current database; the
         cursor is committed and closed after the context block.
     """
-    registry = odoo.registry(common.get_db_name())
-    with registry.cursor() as cr:
+    with get_registry().cursor() as cr:
         yield odoo.api.Environment(cr, ADMIN_USER_ID, {})
         cr.commit()
 
 
-def drop_sequence(code):
+def drop_sequence(codes):
+    """ Drop the sequences with the given code or codes. """
+    codes = [codes] if isinstance(codes, str) else list(codes)
     with environment() as env:
-        seq = env['ir.sequence'].search([('code', '=', code)])
-        seq.unlink()
+        seqs = env['ir.sequence'].search([('code', 'in', codes)])
+        seqs.unlink()
 
 
 class TestIrSequenceStandard(unittest.TestCase):
@@ -93,6 +101,8 @@ class TestIrSequenceNoGap(unittest.TestCase):
         with environment() as env0:
             with environment() as env1:
                 env1.cr._default_log_exceptions = False # Prevent logging a traceback
+                # Fail at once rather than waiting if the lock is not NOWAIT
+                env1.cr.execute("SET LOCAL lock_timeout = '1ms'")
                 with self.assertRaises(psycopg2.OperationalError) as e:
                     n0 = env0['ir.sequence'].next_by_code('test_sequence_type_2')
                     self.assertTrue(n0)
@@ -137,8 +147,7 @@ class TestIrSequenceChangeImplementation(unittest.TestCase):
 
     @classmethod
     def tearDownClass(cls):
-        drop_sequence('test_sequence_type_3')
-        drop_sequence('test_sequence_type_4')
+        drop_sequence(['test_sequence_type_3', 'test_sequence_type_4'])
 
 
 class TestIrSequenceGenerate(unittest.TestCase):
@@ -154,9 +163,10 @@ class TestIrSequenceGenerate(unittest.TestCase):
             self.assertTrue(seq)
 
         with environment() as env:
-            for i in range(1, 10):
-                n = env['ir.sequence'].next_by_code('test_sequence_type_5')
-                self.assertEqual(n, str(i))
+            seq = env['ir.sequence'].search([('code', '=', 'test_sequence_type_5')])
+            self.assertEqual(len(seq), 1)
+            values = [seq._next() for _ in range(9)]
+            self.assertEqual(values, [str(i) for i in range(1, 10)])
 
     def test_ir_sequence_create_no_gap(self):
         """ Try to create a sequence object. """
@@ -169,14 +179,14 @@ class TestIrSequenceGenerate(unittest.TestCase):
             self.assertTrue(seq)
 
         with environment() as env:
-            for i in range(1, 10):
-                n = env['ir.sequence'].next_by_code('test_sequence_type_6')
-                self.assertEqual(n, str(i))
+            seq = env['ir.sequence'].search([('code', '=', 'test_sequence_type_6')])
+            self.assertEqual(len(seq), 1)
+            values = [seq._next() for _ in range(9)]
+            self.assertEqual(values, [str(i) for i in range(1, 10)])
 
     @classmethod
     def tearDownClass(cls):
-        drop_sequence('test_sequence_type_5')
-        drop_sequence('test_sequence_type_6')
+        drop_sequence(['test_sequence_type_5', 'test_sequence_type_6'])
 
 
 class TestIrSequenceInit(common.TransactionCase):